@@ -323,7 +323,63 @@ try:
             # Tiempo de vida media térmica (similar a decaimiento exponencial)
             t_half_life = np.log(2) / k
             st.metric("Vida Media Térmica (ln(2)/k)", f"{t_half_life:.2f} min")
-    
+
+        # Sensibilidad de la predicción respecto a cada parámetro
+        st.subheader("Sensibilidad de Parámetros")
+
+        t_max_sens = st.slider(
+            "Horizonte de tiempo para la sensibilidad (minutos)",
+            min_value=10,
+            max_value=200,
+            value=60,
+            step=5
+        )
+
+        times_sens = np.linspace(0, t_max_sens, 200)
+        _, dT_dT0, dT_dTa, dT_dk = calculator.temperature_sensitivities(times_sens)
+
+        # Sensibilidades escaladas (°C) para comparar parámetros con unidades distintas:
+        # T0 y Ta se perturban en la diferencia inicial |T0 - Ta| y k en su propio valor
+        delta_T = abs(T0 - Ta)
+        scaled_sens = {
+            'T0': delta_T * dT_dT0,
+            'Ta': delta_T * dT_dTa,
+            'k': k * dT_dk
+        }
+        scale_labels = {'T0': '|T0-Ta|', 'Ta': '|T0-Ta|', 'k': 'k'}
+
+        fig_sens = go.Figure()
+        colors_sens = {'T0': '#FF6B6B', 'Ta': '#4ECDC4', 'k': '#95E1D3'}
+        for name, values in scaled_sens.items():
+            fig_sens.add_trace(
+                go.Scatter(
+                    x=times_sens,
+                    y=values,
+                    mode='lines',
+                    name=f'{scale_labels[name]}·∂T/∂{name}',
+                    line=dict(color=colors_sens[name], width=2),
+                    hovertemplate='Tiempo: %{x:.2f} min<br>Sensibilidad: %{y:.2f} °C<extra></extra>'
+                )
+            )
+
+        fig_sens.update_layout(
+            title="Sensibilidad escalada de T(t) respecto a cada parámetro",
+            xaxis_title="Tiempo (min)",
+            yaxis_title="Sensibilidad escalada (°C)",
+            height=400,
+            showlegend=True
+        )
+
+        st.plotly_chart(fig_sens, use_container_width=True)
+
+        # Promedio del valor absoluto sobre el horizonte para que t=0 no domine la comparación
+        dominant = max(scaled_sens, key=lambda name: np.mean(np.abs(scaled_sens[name])))
+        st.info(f"""
+        **Parámetro más influyente en promedio en el horizonte de {t_max_sens} min:** {dominant}
+        - ∂T/∂T0 = e^(-kt), ∂T/∂Ta = 1 - e^(-kt), ∂T/∂k = -t(T0 - Ta)e^(-kt)
+        - Cada curva indica cuántos °C cambia la predicción si T0 o Ta varían en |T0 - Ta| = {delta_T:.2f} °C, o si k varía en su propio valor ({k:.6f} min⁻¹)
+        """)
+
     with tab4:
         st.header("Verificación de la Solución Implícita")
         
@@ -21,9 +21,18 @@ class NewtonCoolingCalculator:
         # Calcula la constante C de la solución implícita ==>  C = ln|T0 - Ta|
         return np.log(abs(self.T0 - self.Ta))
     
+    @staticmethod
+    def _decay_factor(k, t):
+        # Factor de decaimiento exp(-k*t) compartido por T(t) y sus derivadas
+        return np.exp(-k * t)
+    
     def temperature_explicit(self, t):
         # Solución explícita de la ecuación diferencial T(t) = Ta + (T0 - Ta) * exp(-k*t)
-        return self.Ta + (self.T0 - self.Ta) * np.exp(-self.k * t)
+        return self.Ta + (self.T0 - self.Ta) * self._decay_factor(self.k, t)
+    
+    def temperature_sensitivities(self, t):
+        # T(t) y sus derivadas parciales respecto a T0, Ta y k para los parámetros actuales
+        return self.batch_temperature_sensitivities(self.T0, self.Ta, self.k, t)
     
     def temperature_implicit(self, t):
         # Verifica la solución implícita: ln|T - Ta| + k*t = C
@@ -60,6 +69,26 @@ class NewtonCoolingCalculator:
         # Verifica que la solución implícita se mantiene constante, devuelve ~C
         return [self.temperature_implicit(t) for t in times]
     
+    @staticmethod
+    def batch_temperature_sensitivities(T0, Ta, k, t):
+        # Evalúa T(t) y su Jacobiano analítico para muchos conjuntos de parámetros a la vez
+        # T0, Ta y k se combinan entre sí; el resultado tiene forma forma(parámetros) + forma(t)
+        #   dT/dT0 = exp(-k*t)
+        #   dT/dTa = 1 - exp(-k*t)
+        #   dT/dk  = -t * (T0 - Ta) * exp(-k*t)
+        t = np.asarray(t, dtype=float)
+        expand = (Ellipsis,) + (np.newaxis,) * t.ndim
+        T0, Ta, k = (np.asarray(p, dtype=float)[expand] for p in np.broadcast_arrays(T0, Ta, k))
+        
+        decay = NewtonCoolingCalculator._decay_factor(k, t)
+        diff_decay = (T0 - Ta) * decay
+        
+        T = Ta + diff_decay
+        dT_dT0 = decay
+        dT_dTa = 1 - decay
+        dT_dk = -t * diff_decay
+        return T, dT_dT0, dT_dTa, dT_dk
+    
     @staticmethod
     def calculate_k_from_data(T0, Ta, T_measured, t_measured):
         # Calcula la constante k a partir de datos experimentales
@@ -0,0 +1,54 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from newton_cooling_calculator import NewtonCoolingCalculator
+
+
+T0, TA, K = 300.0, 20.0, 0.088367
+TIMES = np.linspace(0, 60, 200)
+
+
+@pytest.mark.parametrize("index", [0, 1, 2])
+def test_partials_match_central_finite_differences(index):
+    # Compara cada derivada analítica con diferencias finitas centrales
+    params = np.array([T0, TA, K])
+    h = 1e-6 * max(1.0, abs(params[index]))
+    step = np.zeros(3)
+    step[index] = h
+
+    plus = NewtonCoolingCalculator(*(params + step)).temperature_explicit(TIMES)
+    minus = NewtonCoolingCalculator(*(params - step)).temperature_explicit(TIMES)
+    finite_diff = (plus - minus) / (2 * h)
+
+    analytic = NewtonCoolingCalculator(T0, TA, K).temperature_sensitivities(TIMES)[index + 1]
+    np.testing.assert_allclose(analytic, finite_diff, rtol=1e-6, atol=1e-6)
+
+
+def test_temperature_matches_explicit_solution():
+    calculator = NewtonCoolingCalculator(T0, TA, K)
+    T = calculator.temperature_sensitivities(TIMES)[0]
+    np.testing.assert_allclose(T, calculator.temperature_explicit(TIMES))
+
+
+def test_batched_parameters_shape():
+    outputs = NewtonCoolingCalculator.batch_temperature_sensitivities(
+        [300.0, 250.0], TA, [0.05, K], TIMES
+    )
+    for output in outputs:
+        assert output.shape == (2, 200)
+
+    # Cada fila coincide con la evaluación de ese conjunto de parámetros por separado
+    single = NewtonCoolingCalculator(250.0, TA, K).temperature_sensitivities(TIMES)
+    for batched, expected in zip(outputs, single):
+        np.testing.assert_allclose(batched[1], expected)
+
+
+def test_outputs_are_writable():
+    outputs = NewtonCoolingCalculator.batch_temperature_sensitivities(T0, TA, K, TIMES)
+    for output in outputs:
+        assert output.flags.writeable